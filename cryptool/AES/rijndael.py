@@ -1,5 +1,9 @@
 # This file is about finite multiplicative groups with rijndael structure for the Cryptool project.
 
+import functools
+
+import numpy as np
+
 from cryptool.group import Group
 from cryptool.utils import int2poly
 
@@ -13,7 +17,7 @@ class F2nMul(Group):
         """
         self.p = p
         self.n = p.bit_length() - 1
-        self.N = 2**self.n - 1
+        self.N = (1 << self.n) - 1
         self.e = 1 
 
     def loi(self, x: int, y: int) -> int:
@@ -25,14 +29,20 @@ class F2nMul(Group):
         Returns:
             int: The product of x and y in F_2^n.
         """
+        # Carry-less product first: xor shifted copies of x, one per set bit
+        # of y, without reducing at every step (CLMUL-style split of the
+        # multiplication and the reduction).
         z = 0
         while y != 0:
-            if (y & 1) > 0:
-                z ^= x
-            x <<= 1
-            if x.bit_length() > self.n:
-                x ^= self.p
-            y >>= 1
+            lsb = y & -y
+            z ^= x << (lsb.bit_length() - 1)
+            y ^= lsb
+
+        # Single reduction pass: align p with the leading bit of z until the
+        # result fits back in n bits.
+        p, n = self.p, self.n
+        while z.bit_length() > n:
+            z ^= p << (z.bit_length() - p.bit_length())
         return z
     
 def rotateLeft(byte: int, n: int) -> int:
@@ -59,29 +69,42 @@ def rotateRight(byte: int, n: int) -> int:
     n = n % 8
     return (byte >> n) | ((byte << (8 - n)) & 0xFF)
 
-def sbox():
-    """Generate the AES S-box using the F_2^8 multiplicative group.
+@functools.cache
+def _build_sbox() -> bytes:
+    """Build the AES S-box using the F_2^8 multiplicative group.
 
     Returns:
-        list[int]: The AES S-box as a list of 256 integers.
+        bytes: The AES S-box as an immutable 256-byte table.
     """
     P = 0x11B  # Irreducible polynomial for AES (x^8 + x^4 + x^3 + x + 1)
     group = F2nMul(P)
 
-    sbox = [0] * 256
-    for i in range(256):
-        if i == 0:
-            inv = 0
-        else:
-            inv = group.exp(i, -1)
-        
-        transformed = inv
-        transformed ^= rotateLeft(inv, 1)
-        transformed ^= rotateLeft(inv, 2)
-        transformed ^= rotateLeft(inv, 3)
-        transformed ^= rotateLeft(inv, 4)
-        transformed ^= 0x63  
+    inv = np.fromiter((group.exp(i, -1) if i else 0 for i in range(256)),
+                      dtype=np.uint8, count=256)
+
+    # Affine transform applied to the whole inverse vector at once.
+    rot = lambda v, n: ((v << n) | (v >> (8 - n))) & np.uint8(0xFF)
+    sbox = inv ^ rot(inv, 1) ^ rot(inv, 2) ^ rot(inv, 3) ^ rot(inv, 4) ^ np.uint8(0x63)
+
+    return sbox.tobytes()
+
+SBOX = _build_sbox()
 
-        sbox[i] = transformed & 0xFF
+def sbox() -> bytes:
+    """Return the AES S-box, computed once at module import.
 
-    return sbox
\ No newline at end of file
+    Returns:
+        bytes: The AES S-box as an immutable 256-byte table. Callers that
+        need a mutable copy should use bytearray(SBOX).
+    """
+    return SBOX
+
+def subBytes(state: bytes) -> bytes:
+    """Apply the AES SubBytes step to a block of bytes.
+
+    Args:
+        state (bytes): The state bytes to substitute (typically 16 bytes).
+    Returns:
+        bytes: The state with every byte replaced by its S-box entry.
+    """
+    return bytes(state).translate(SBOX)
\ No newline at end of file
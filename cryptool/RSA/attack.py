@@ -2,6 +2,11 @@
 
 from cryptool.utils import inverse, integerCubeRoot
 
+try:
+    from gmpy2 import iroot, mpz
+except ImportError:
+    iroot = None
+
 
 def commonModulus(N: int, e1: int, e2: int, c1: int, c2: int) -> int:
     """Perform common modulus attack on RSA encrypted messages.
@@ -50,5 +55,8 @@ def commonExponent(N1: int, N2: int, N3: int, c1: int, c2: int, c3: int) -> int:
     M = c1 * m1 * u1 + c2 * m2 * u2 + c3 * m3 * u3
     M = M % (N1 * N2 * N3)
 
-    m = integerCubeRoot(M)
+    if iroot is not None:
+        m = int(iroot(mpz(M), 3)[0])
+    else:
+        m = integerCubeRoot(M)
     return m
\ No newline at end of file
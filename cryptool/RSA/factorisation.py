@@ -1,29 +1,44 @@
 # This file contains functions related to RSA encryption for the Cryptool project.
 
-from math import sqrt, ceil
+from random import randint
+
+from cryptool.prime import SMALL_PRIMES
 from cryptool.utils import gcd
-from decimal import Decimal, getcontext
+
+try:
+    from gmpy2 import isqrt, mpz
+except ImportError:
+    from math import isqrt
+    mpz = int
 
 
-# Set precision for Decimal calculations
-getcontext().prec = 1024
+# Residues mod 720 that a perfect square can take, used to reject Fermat
+# candidates in O(1) before the exact square-root test.
+_QR_MOD_720 = frozenset((x * x) % 720 for x in range(720))
 
 def naiveFactor(N: int) -> tuple[int, int] | None:
-    """Perform naive factorization of n by trial division.
-    
+    """Perform naive factorization of N by ascending trial division.
+
     Args:
         N (int): The integer to be factorized.
-        
+
     Returns:
         tuple[int, int] | None: A tuple containing the two factors of N if found, otherwise None.
     """
 
-    limit = ceil(sqrt(N))
+    for p in SMALL_PRIMES:
+        if p * p > N:
+            return None
+        if N % p == 0:
+            return p, N // p
 
-    for i in range(limit, 1, -1):
+    # No factor below 2^16: keep walking the odd candidates.
+    i = SMALL_PRIMES[-1] + 2
+    while i * i <= N:
         if N % i == 0:
             return i, N // i
-        
+        i += 2
+
     return None
 
 def _isSquare(n: int) -> bool:
@@ -36,7 +51,7 @@ def _isSquare(n: int) -> bool:
         bool: True if n is a perfect square, False otherwise.
     """
 
-    root = int(sqrt(n))
+    root = isqrt(n)
     return root * root == n
 
 def fermatFactor(N: int) -> tuple[int, int]:
@@ -49,25 +64,94 @@ def fermatFactor(N: int) -> tuple[int, int]:
         tuple[int, int]: A tuple containing the two factors of N.
     """
 
-    a = ceil(sqrt(N))
+    a = isqrt(N)
+    if a * a < N:
+        a += 1
     b2 = a * a - N
-
-    while not _isSquare(b2):
+    b2_mod = b2 % 720
+
+    # Each a += 1 increases b2 by 2a + 1, so the residue mod 720 is kept
+    # incrementally and most candidates are rejected without an isqrt.
+    while b2_mod not in _QR_MOD_720 or not _isSquare(b2):
+        step = 2 * a + 1
+        b2 += step
+        b2_mod = (b2_mod + step) % 720
         a += 1
-        b2 = a * a - N
 
-    b = int(sqrt(b2))
-    return a - b, a + b
+    b = isqrt(b2)
+    return int(a - b), int(a + b)
+
+def pollardBrent(N: int) -> tuple[int, int] | None:
+    """Perform Brent's variant of Pollard's Rho factorization on N.
+
+    Differences from Floyd's version: Brent's cycle finding needs one
+    function evaluation per step instead of three, and the gcd is taken
+    on a product accumulated over batches of 128 steps instead of on
+    every step.
+
+    Args:
+        N (int): The integer to be factorized.
+    Returns:
+        tuple[int, int] | None: A tuple containing the two factors of N if found, otherwise None.
+    """
+
+    if N % 2 == 0:
+        return 2, N // 2
+
+    y = randint(1, N - 1)
+    c = randint(1, N - 1)
+    m = 128
+
+    g = r = q = 1
+    x = ys = y
+
+    while g == 1:
+        x = y
+        for _ in range(r):
+            y = (y * y + c) % N
+
+        k = 0
+        while k < r and g == 1:
+            ys = y
+            for _ in range(min(m, r - k)):
+                y = (y * y + c) % N
+                q = q * abs(x - y) % N
+            g = gcd(q, N)
+            k += m
+        r *= 2
+
+    if g == N:
+        # The batch collapsed to N: rewind it and test every step.
+        while True:
+            ys = (ys * ys + c) % N
+            g = gcd(abs(x - ys), N)
+            if g > 1:
+                break
+
+    if g == N:
+        return None
+    return g, N // g
 
 def pollardRho(N : int) -> tuple[int, int] | None:
-    """Perform Pollard's Rho factorization method on n.
+    """Perform Pollard's Rho factorization method on N.
 
     Args:
         N (int): The integer to be factorized.
     Returns:
         tuple[int, int] | None: A tuple containing the two factors of N if found, otherwise None.
     """
-    
+
+    return pollardBrent(N)
+
+def pollardRhoFloyd(N : int) -> tuple[int, int] | None:
+    """Perform Pollard's Rho factorization with Floyd's cycle finding.
+
+    Args:
+        N (int): The integer to be factorized.
+    Returns:
+        tuple[int, int] | None: A tuple containing the two factors of N if found, otherwise None.
+    """
+
     x = 2
     y = 2
     d = 1
@@ -96,10 +180,10 @@ def factorizNwithPhi(N: int, phi: int) -> tuple[int, int]:
     b = phi - N - 1
     delta = b * b - 4 * N
 
-    sqrtDelta = Decimal(delta).sqrt()
+    sqrtDelta = isqrt(delta)
 
-    p = ( -b + sqrtDelta ) / 2
-    q = ( -b - sqrtDelta ) / 2
+    p = ( -b + sqrtDelta ) // 2
+    q = ( -b - sqrtDelta ) // 2
 
     return int(p), int(q)
 
@@ -127,55 +211,68 @@ def factorizeNwithD(N: int, d: int, e: int) -> tuple[int, int] | None:
         s //= 2
         r += 1
 
+    # Convert the shared operands once so the 98 exponentiations and all
+    # the squarings below run on GMP integers when gmpy2 is installed.
+    N = mpz(N)
+    s = mpz(s)
+    minus_one = N - 1
+
     for a in range(2, 100):
-        x = pow(a, s, N)
+        x = pow(mpz(a), s, N)
 
-        if x == 1 or x == N - 1:
+        if x == 1 or x == minus_one:
             continue
 
         for _ in range(r):
             x_prev = x
-            x = pow(x, 2, N)
+            x = (x * x) % N
 
             if x == 1:
-                p = gcd(x_prev - 1, N)
-                q = N // p
+                p = int(gcd(x_prev - 1, N))
+                q = int(N) // p
                 return p, q
 
-            if x == N - 1:
+            if x == minus_one:
                 break
 
     return None
 
-def reducesRationals(A: int, B: int) -> tuple[list[int], list[int]]:
-    """Compute the continued fraction expansion of A/B.
+def convergents(A: int, B: int):
+    """Yield the convergents of the continued fraction expansion of A/B.
 
     Args:
         A (int): The numerator.
         B (int): The denominator.
 
-    Returns:
-        tuple[list[int], list[int]]: Two lists containing the numerators and denominators of the convergents.
+    Yields:
+        tuple[int, int]: The numerator and denominator of each convergent.
     """
 
-    ui = [1]
-    vi = [0, 1]
-    ai = [1]
-    a1 = A // B
-    ai.append(a1)
-    ui.append(a1)
-    A, B = B, A % B
+    u0, u1 = 0, 1
+    v0, v1 = 1, 0
 
     while B != 0:
-        q = A // B
-        ai.append(q)
-        r = A % B
+        q, r = divmod(A, B)
         A, B = B, r
-        ui.append(ui[-1]*ai[-1] + ui[-2])
-        vi.append(vi[-1]*ai[-1] + vi[-2])
+        u0, u1 = u1, q*u1 + u0
+        v0, v1 = v1, q*v1 + v0
+        yield u1, v1
+
+def reducesRationals(A: int, B: int) -> tuple[list[int], list[int]]:
+    """Compute the continued fraction expansion of A/B.
+
+    Args:
+        A (int): The numerator.
+        B (int): The denominator.
+
+    Returns:
+        tuple[list[int], list[int]]: Two lists containing the numerators and denominators of the convergents.
+    """
 
-    ui.pop(0)
-    vi.pop(0)
+    ui, vi = [], []
+    for u, v in convergents(A, B):
+        ui.append(u)
+        vi.append(v)
     return ui, vi
 
 def wienerAttack(N: int, e: int) -> tuple[int, int] | None:
@@ -189,18 +286,16 @@ def wienerAttack(N: int, e: int) -> tuple[int, int] | None:
         tuple[int, int] | None: A tuple containing the two factors of N if found, otherwise None.
     """
 
-    ki, di = reducesRationals(N, e)
-
-    for i in range(len(ki)):
-        if di[i] == 0:
+    for k, d in convergents(N, e):
+        if d == 0:
             continue
 
-        phiN = (e * ki[i] - 1) // di[i]
-        
+        phiN = (e * k - 1) // d
+
         if phiN > N:
             continue
         p, q = factorizNwithPhi(N, phiN)
-        
+
         if p * q == N:
             return p, q
 
@@ -1,8 +1,9 @@
 # This file contains functions related to group theory for the Cryptool project.
 
+import functools
 from abc import ABC, abstractmethod
 from random import randint
-from math import log, ceil, sqrt
+from math import ceil, sqrt
 from sympy.ntheory import factorint
 from cryptool.utils import chineseRemainder
 
@@ -34,36 +35,49 @@ class Group(ABC):
             return self.e
         
         h = self.e
-        t = int(log(k, 2)) + 1
+        loi = self.loi
+        t = k.bit_length() - 1
         for i in range(t, -1, -1):
-            h = self.loi(h, h)
+            h = loi(h, h)
             if ((k >> i) & 1) == 1:
-                h = self.loi(h, g)
+                h = loi(h, g)
         return h
-    
+
     def DLnaive(self, g: int, h: int) -> int:
         """Naive discrete logarithm function."""
+        loi = self.loi
         x, k = self.e, 0
         while(x != h):
-            x = self.loi(x, g) % self.p
+            x = loi(x, g)
             k += 1
         return k
     
+    @staticmethod
+    def _hashable(value):
+        """Return a hashable form of a group element, for use as a dict key.
+
+        Elliptic-curve points are lists, so they are converted to tuples;
+        integer elements pass through unchanged.
+        """
+        return tuple(value) if isinstance(value, list) else value
+
     def babyStepGiantStep(self, g: int, h: int) -> int:
         """Baby-step giant-step algorithm for discrete logarithm."""
         w = ceil(sqrt(self.N))
-        tabI = []
+        table = {}
         for i in range(w+1):
-            tabI.append(self.exp(g, i*w))
-        
-        j = 0
-        while (self.loi(h, self.exp(g, self.N - j)) not in tabI):
-            j += 1
-        
-        x = self.loi(h, self.exp(g, self.N - j))
-        i = tabI.index(x)
+            table[self._hashable(self.exp(g, i*w))] = i
 
-        return w*i + j
+        g_inv = self.exp(g, self.N - 1)
+
+        current = h
+        for j in range(w):
+            key = self._hashable(current)
+            if key in table:
+                return w * table[key] + j
+            current = self.loi(current, g_inv)
+
+        return None
     
     def calculDL(self, g: int, h: int, t: int = 1000) -> int:
         """Calculate the discrete logarithm using an appropriate method."""
@@ -94,7 +108,13 @@ class ZpMult(Group):
 
     def loi(self, g1: int, g2: int) -> int:
         return (g1 * g2) % self.p
-    
+
+    def exp(self, g: int, k: int) -> int:
+        """Perform fast exponentiation with the C-level built-in pow."""
+        if k == -1:
+            return pow(g, self.N - 1, self.p)
+        return pow(g, k, self.p)
+
     def inv(self, g: int) -> int:
         return pow(g, -1, self.p)
     
@@ -104,47 +124,73 @@ class ZpMulWithOrder(ZpMult):
         super().__init__(p)
         self.N = N
 
-    def ShanksAlgorithm(self, g: int, h: int) -> int:
-        """Shanks' algorithm for discrete logarithm."""
-        m = ceil(sqrt(self.N))
+    @functools.cached_property
+    def _factors(self) -> dict:
+        """Prime factorization of the group order, computed on first use."""
+        return factorint(self.N)
+
+    def _buildBSGSTable(self, g: int, m: int) -> dict:
+        """Build the baby-step table mapping g^j to j for j in range(m)."""
+        loi = self.loi
         table = {}
 
+        value = self.e
         for j in range(m):
-            value = self.exp(g, j)
             table[value] = j
+            value = loi(value, g)
+        return table
 
-        g_inv_m = self.exp(g, self.N - m)
+    def _lookupBSGS(self, h: int, table: dict, g_inv_m: int, m: int) -> int:
+        """Run the giant steps of h against a prebuilt baby-step table."""
+        loi = self.loi
 
         current = h
         for i in range(m):
             if current in table:
                 return i * m + table[current]
-            current = self.loi(current, g_inv_m)
-        
+            current = loi(current, g_inv_m)
+
         return None
+
+    def ShanksAlgorithm(self, g: int, h: int) -> int:
+        """Shanks' algorithm for discrete logarithm."""
+        m = ceil(sqrt(self.N))
+        table = self._buildBSGSTable(g, m)
+        g_inv_m = self.exp(g, self.N - m)
+        return self._lookupBSGS(h, table, g_inv_m, m)
     
     def DLinGroupofPrimePowerOrder(self, g: int, h: int, q: int, n: int) -> int:
         """Discrete logarithm in a group of prime power order."""
         i = 0
+        g_pow_i = 1
         y = pow(g, pow(q, n-1, self.N), self.p)
-        
+
+        # Every digit solves a discrete log in the same order-q subgroup
+        # generated by y, so the baby-step table is built only once.
+        subgroup = ZpMulWithOrder(self.p, q)
+        m = ceil(sqrt(q))
+        table = subgroup._buildBSGSTable(y, m)
+        y_inv_m = subgroup.exp(y, q - m)
+
         for j in range(n):
             e_j = pow(q, n - j - 1, self.N)
-            h_j = pow(h * self.inv(pow(g, i, self.p)), e_j, self.p)
-            
-            subgroup = ZpMulWithOrder(self.p, q)
-            d_j = subgroup.ShanksAlgorithm(y, h_j)
+            h_j = pow(h * self.inv(g_pow_i), e_j, self.p)
 
-            i += d_j * pow(q, j, self.N)
+            d_j = subgroup._lookupBSGS(h_j, table, y_inv_m, m)
+
+            # g^i follows i incrementally instead of being recomputed
+            # from scratch on every iteration.
+            step = d_j * pow(q, j, self.N)
+            i += step
+            g_pow_i = (g_pow_i * pow(g, step, self.p)) % self.p
         return i
     
     def pohligHellman(self, g: int, h: int) -> int:
         """Pohlig-Hellman algorithm for discrete logarithm."""
-        factors = factorint(self.N)
+        factors = self._factors
         ijs = []
 
         for p, e in factors.items():
-            print(f"Processing prime factor {p}^{e}")
             g_j = pow(g, (self.N // pow(p, e)), self.p)
             h_j = pow(h, (self.N // pow(p, e)), self.p)
 
@@ -158,6 +204,13 @@ class ZpMulWithOrder(ZpMult):
 
 class ECConZp(Group):
     """Elliptic Curve over Zp.
+
+        Affine points are [x, y] lists, matching the constructor's G and e
+        arguments; tuples only appear internally for Jacobian coordinates.
+        Lists are unhashable, so inherited algorithms that build lookup
+        tables must key them through Group._hashable, as
+        babyStepGiantStep does.
+
         Args:
             A (int): Coefficient A of the elliptic curve.
             B (int): Coefficient B of the elliptic curve.
@@ -172,21 +225,98 @@ class ECConZp(Group):
         self.B = B
         self.G = G
 
+    def _toJacobian(self, P: list) -> tuple:
+        """Convert an affine point to Jacobian coordinates (X, Y, Z)."""
+        if P == self.e:
+            return (1, 1, 0)
+        return (P[0], P[1], 1)
+
+    def _fromJacobian(self, P: tuple) -> list:
+        """Convert a Jacobian point back to affine coordinates.
+
+        This is the only place a modular inversion happens: x = X/Z^2 and
+        y = Y/Z^3 are recovered with a single inverse of Z.
+        """
+        X, Y, Z = P
+        if Z == 0:
+            return self.e
+
+        p = self.p
+        zInv = pow(Z, -1, p)
+        zInv2 = (zInv * zInv) % p
+        return [(X * zInv2) % p, (Y * zInv2 * zInv) % p]
+
+    def _doubleJacobian(self, P: tuple) -> tuple:
+        """Double a Jacobian point using only field multiplications."""
+        X, Y, Z = P
+        if Z == 0 or Y == 0:
+            return (1, 1, 0)
+
+        p = self.p
+        Y2 = (Y * Y) % p
+        S = (4 * X * Y2) % p
+        M = (3 * X * X + self.A * pow(Z, 4, p)) % p
+
+        X3 = (M * M - 2 * S) % p
+        Y3 = (M * (S - X3) - 8 * Y2 * Y2) % p
+        Z3 = (2 * Y * Z) % p
+        return (X3, Y3, Z3)
+
+    def _addJacobian(self, P: tuple, Q: tuple) -> tuple:
+        """Add two Jacobian points using only field multiplications."""
+        if P[2] == 0:
+            return Q
+        if Q[2] == 0:
+            return P
+
+        p = self.p
+        X1, Y1, Z1 = P
+        X2, Y2, Z2 = Q
+
+        Z1_2 = (Z1 * Z1) % p
+        Z2_2 = (Z2 * Z2) % p
+        U1 = (X1 * Z2_2) % p
+        U2 = (X2 * Z1_2) % p
+        S1 = (Y1 * Z2_2 * Z2) % p
+        S2 = (Y2 * Z1_2 * Z1) % p
+
+        if U1 == U2:
+            if S1 != S2:
+                return (1, 1, 0)
+            return self._doubleJacobian(P)
+
+        H = (U2 - U1) % p
+        R = (S2 - S1) % p
+        H2 = (H * H) % p
+        H3 = (H * H2) % p
+        U1H2 = (U1 * H2) % p
+
+        X3 = (R * R - H3 - 2 * U1H2) % p
+        Y3 = (R * (U1H2 - X3) - S1 * H3) % p
+        Z3 = (H * Z1 * Z2) % p
+        return (X3, Y3, Z3)
+
     def exp(self, P: list, k: int) -> list:
-        """Perform fast exponentiation on the elliptic curve."""
+        """Perform fast exponentiation on the elliptic curve.
+
+        The ladder runs in Jacobian coordinates so that the whole scalar
+        multiplication costs a single modular inversion, in the final
+        conversion back to affine.
+        """
         if k == -1:
             return self.exp(P, (self.N)-1)
 
         if k == 0:
             return self.e
-        
-        R = self.e
-        t = int(log(k, 2)) + 1
+
+        R = (1, 1, 0)
+        Q = self._toJacobian(P)
+        t = k.bit_length() - 1
         for i in range(t, -1, -1):
-            R = self.loi(R, R)
+            R = self._doubleJacobian(R)
             if ((k >> i) & 1) == 1:
-                R = self.loi(R, P)
-        return R
+                R = self._addJacobian(R, Q)
+        return self._fromJacobian(R)
 
     def loi(self, P: list, Q: list) -> list:
         """Define the group operation (point addition) on the elliptic curve."""
@@ -252,13 +382,28 @@ class ECConZp(Group):
         if ( not(t > 0 and t <= (self.N -1)) or not(s > 0 and s <= (self.N -1))):
             print("Var t or s not in the scope.")
             return False
-        
-        R1 = self.exp(self.G, m * pow(s, -1, self.N))
-        R2 = self.exp(Q, t * pow(s, -1, self.N))
 
-        R = self.loi(R1, R2)
+        s_inv = pow(s, -1, self.N)
+        u1 = (m * s_inv) % self.N
+        u2 = (t * s_inv) % self.N
+
+        # Shamir's trick: scan the bits of u1 and u2 together so the two
+        # scalar multiplications share a single doubling chain.
+        table = [None, self._toJacobian(self.G), self._toJacobian(Q),
+                 self._toJacobian(self.loi(self.G, Q))]
+
+        R = (1, 1, 0)
+        for i in range(max(u1.bit_length(), u2.bit_length()) - 1, -1, -1):
+            R = self._doubleJacobian(R)
+            idx = ((u1 >> i) & 1) | (((u2 >> i) & 1) << 1)
+            if idx:
+                R = self._addJacobian(R, table[idx])
+        R = self._fromJacobian(R)
+
+        if R == self.e:
+            return False
 
         if R[0] % self.N == t:
             return True
-        
+
         return False
\ No newline at end of file
@@ -1,30 +1,105 @@
 # This file contains functions related to prime numbers for the Cryptool project.
 
+import concurrent.futures
+import functools
+import os
 import random
 
-def _temoinMillerRabin(a: int, p: int) -> bool:
-    """Perform the Miller-Rabin primality test.
-    
+import numpy as np
+
+try:
+    import gmpy2
+except ImportError:
+    gmpy2 = None
+
+def _sievePrimes(limit: int) -> tuple[int, ...]:
+    """Sieve of Eratosthenes returning all primes below limit.
+
     Args:
-        a (int): The base for the test.
-        p (int): The odd integer to be tested for primality.
-        
+        limit (int): The exclusive upper bound of the sieve.
+
     Returns:
-        bool: True if p is probably prime, False if p is composite.
+        tuple[int, ...]: All primes below limit, in ascending order.
     """
 
+    sieve = bytearray([1]) * limit
+    sieve[0:2] = b"\x00\x00"
+    for i in range(2, int(limit ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i*i::i] = bytes(len(range(i*i, limit, i)))
+    return tuple(i for i, isP in enumerate(sieve) if isP)
+
+# All primes below 2^16, used for trial division.
+SMALL_PRIMES = _sievePrimes(1 << 16)
+
+# Residues mod 30 of integers coprime to 30; any other residue means a
+# factor of 2, 3 or 5.
+_WHEEL30 = frozenset((1, 7, 11, 13, 17, 19, 23, 29))
+
+# First 128 primes, used as trial divisors before Miller-Rabin.
+_TRIAL_PRIMES = SMALL_PRIMES[:128]
+
+def _buildSmallPrimeBitmap(limit: int) -> bytes:
+    """Bit-pack the primality of every integer below limit.
+
+    Args:
+        limit (int): The exclusive upper bound, a multiple of 8.
+
+    Returns:
+        bytes: A table with bit p set iff p is prime.
+    """
+
+    bitmap = bytearray(limit >> 3)
+    for p in SMALL_PRIMES:
+        if p >= limit:
+            break
+        bitmap[p >> 3] |= 1 << (p & 7)
+    return bytes(bitmap)
+
+# 4 KB direct-lookup table answering primality below 2^15 in O(1).
+_SMALL_PRIME_BITMAP = _buildSmallPrimeBitmap(1 << 15)
+
+# Miller-Rabin witnesses that are deterministic for all p < 3.3 * 10^24,
+# which covers every 64-bit candidate.
+_DETERMINISTIC_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+
+# The wheel residues in order, and the gap from each one to the next.
+_WHEEL30_RESIDUES = (1, 7, 11, 13, 17, 19, 23, 29)
+_WHEEL30_GAPS = (6, 4, 2, 4, 2, 4, 6, 2)
+
+def _decomposeOdd(p: int) -> tuple[int, int]:
+    """Write p - 1 as 2^k * q with q odd.
+
+    Args:
+        p (int): The odd integer being tested.
+
+    Returns:
+        tuple[int, int]: The odd part q and the power k.
+    """
+
+    # The count of trailing zeros comes from the isolated lowest set bit.
     q = p - 1
-    k = 0
+    k = (q & -q).bit_length() - 1
+    return q >> k, k
+
+def _millerRabinRound(a: int, p: int, q: int, k: int) -> bool:
+    """Run one Miller-Rabin round given the decomposition p - 1 = 2^k * q.
+
+    Args:
+        a (int): The base for the round.
+        p (int): The odd integer to be tested for primality.
+        q (int): The odd part of p - 1.
+        k (int): The power of two in p - 1.
+
+    Returns:
+        bool: True if p is probably prime for this base, False if composite.
+    """
 
-    while q % 2 == 0:
-        q //= 2
-        k += 1
-    
     b = pow(a, q, p)
 
     if b == 1 or b == p - 1:
         return True
-    
+
     while k > 0:
         b = (b * b) % p
         if b == p - 1:
@@ -32,6 +107,20 @@ def _temoinMillerRabin(a: int, p: int) -> bool:
         k -= 1
     return False
 
+def _temoinMillerRabin(a: int, p: int) -> bool:
+    """Perform the Miller-Rabin primality test.
+
+    Args:
+        a (int): The base for the test.
+        p (int): The odd integer to be tested for primality.
+
+    Returns:
+        bool: True if p is probably prime, False if p is composite.
+    """
+
+    q, k = _decomposeOdd(p)
+    return _millerRabinRound(a, p, q, k)
+
 def millerRabin(p: int, n: int) -> bool:
     """Perform the Miller-Rabin primality test n times to determine if p is probably prime.
     
@@ -48,31 +137,41 @@ def millerRabin(p: int, n: int) -> bool:
     if p <= 3:
         return True
 
+    # Converted once here, p stays a GMP integer through all n rounds so
+    # every pow below runs on GMP limbs.
+    if gmpy2 is not None:
+        p = gmpy2.mpz(p)
+
+    q, k = _decomposeOdd(p)
     for _ in range(n):
         a = random.randint(2, p - 2)
-        if not _temoinMillerRabin(a, p):
+        if not _millerRabinRound(a, p, q, k):
             return False
     return True
 
-def gatherPrimes(filePath: str) -> list[int]:
-    """Read prime numbers from a file and return them as a list of integers.
-    
+@functools.lru_cache(maxsize=1)
+def gatherPrimes(filePath: str) -> np.ndarray:
+    """Read prime numbers from a file into a compact uint32 array.
+
+    The parsed primes are cached, so the file is read and converted only
+    once per process. The array form keeps the whole table in 400 KB of
+    contiguous memory instead of ~100000 boxed Python integers.
+
     Args:
         filePath (str): The path to the file containing prime numbers.
-        
+
     Returns:
-        list[int]: A list of prime numbers read from the file.
+        np.ndarray: The prime numbers read from the file, as uint32.
     """
 
-    primes = []
     with open(filePath, 'r') as file:
-        for line in file:
-            primes.append(int(line.strip()))
+        primes = np.fromiter(map(int, file), dtype=np.uint32)
+    primes.setflags(write=False)
     return primes
 
 def isPrime(p: int) -> bool:
-    """Test if p is prime using trial division up to the square root of p.
-    
+    """Test if p is prime using a wheel filter, trial division and Miller-Rabin.
+
     Args:
         p (int): The integer to be tested for primality.
 
@@ -80,14 +179,44 @@ def isPrime(p: int) -> bool:
         bool: True if p is probably prime, False if p is composite.
     """
 
-    # Prime list is in ../public/primes_100000.txt
-    primeList = gatherPrimes("./public/primes_100000.txt")
-    for prime in primeList:
-        if prime == p:
+    if p < 2:
+        return False
+    if p < (1 << 15):
+        return bool(_SMALL_PRIME_BITMAP[p >> 3] & (1 << (p & 7)))
+    if p % 30 not in _WHEEL30:
+        return False
+
+    for prime in _TRIAL_PRIMES:
+        if prime * prime > p:
             return True
         if p % prime == 0:
-            return False
-        
+            return p == prime
+
+    # For candidates fitting in 64 bits, one vectorized pass over the whole
+    # table replaces 100000 interpreted divisions.
+    if p.bit_length() <= 62:
+        primes = gatherPrimes("./public/primes_100000.txt")
+        hits = np.where(np.uint64(p) % primes == 0)[0]
+        if hits.size:
+            return int(primes[hits[0]]) == p
+
+    # Twelve fixed witnesses decide primality exactly in this range; no
+    # need for 40 random rounds.
+    if p.bit_length() <= 64:
+        q, k = _decomposeOdd(p)
+        for a in _DETERMINISTIC_WITNESSES:
+            if not _millerRabinRound(a, p, q, k):
+                return False
+        return True
+
+    # GMP runs the whole Miller-Rabin pipeline in C when available.
+    if gmpy2 is not None:
+        return bool(gmpy2.is_prime(p, 40))
+
+    # Cheap base-2 strong probable prime test before the full battery.
+    if not _temoinMillerRabin(2, p):
+        return False
+
     return millerRabin(p, 40)
 
 def genPrime(n: int) -> int:
@@ -101,9 +230,115 @@ def genPrime(n: int) -> int:
     """
 
     x = random.randint(1<<(n-1), (1<<(n)))
-    if x % 2 == 0:
+
+    # Candidates this big make each Miller-Rabin test expensive enough to
+    # amortize spawning a process pool over the search.
+    if n >= 1024:
+        return _genPrimeParallel(x)
+
+    if n > 16:
+        return _genPrimeSieved(x)
+
+    # The wheel's residues start at 7, so 2, 3 and 5 would be skipped;
+    # scan tiny starts directly before entering it.
+    while x <= 7:
+        if isPrime(x):
+            return x
         x += 1
 
+    # Small candidates overlap the sieve table itself; advance x to the
+    # next residue coprime to 30, then step the wheel: this skips every
+    # multiple of 2, 3 and 5 without testing it.
+    r = x % 30
+    idx = 0
+    while idx < len(_WHEEL30_RESIDUES) and _WHEEL30_RESIDUES[idx] < r:
+        idx += 1
+    if idx == len(_WHEEL30_RESIDUES):
+        x += 31 - r
+        idx = 0
+    else:
+        x += _WHEEL30_RESIDUES[idx] - r
+
     while (not isPrime(x)):
-        x += 2
+        x += _WHEEL30_GAPS[idx]
+        idx = (idx + 1) % len(_WHEEL30_GAPS)
     return x
+
+def _genPrimeSieved(x: int, window: int = 1 << 15) -> int:
+    """Find the first prime at or after x using a segmented sieve.
+
+    The window of odd candidates x, x+2, ... is sieved by the small
+    primes once, so the expensive primality test only runs on the few
+    survivors instead of on every candidate.
+
+    Args:
+        x (int): The starting candidate, larger than 2^16.
+        window (int, optional): The number of odd candidates per segment.
+
+    Returns:
+        int: The first prime at or after x.
+    """
+
+    if x % 2 == 0:
+        x += 1
+
+    while True:
+        survivors = _sieveWindow(x, window)
+
+        for i in range(window):
+            if survivors[i] and isPrime(x + 2*i):
+                return x + 2*i
+
+        x += 2 * window
+
+def _sieveWindow(x: int, window: int) -> bytearray:
+    """Mark which odd candidates x + 2i survive small-prime sieving.
+
+    Args:
+        x (int): The odd starting candidate.
+        window (int): The number of odd candidates in the segment.
+
+    Returns:
+        bytearray: One flag per candidate, 1 if no small prime divides it.
+    """
+
+    survivors = bytearray([1]) * window
+
+    for q in SMALL_PRIMES[1:]:
+        # First index i with (x + 2i) % q == 0; 2^-1 mod q is (q+1)/2.
+        i = ((-x) % q) * ((q + 1) // 2) % q
+        survivors[i::q] = bytes((window - i + q - 1) // q)
+
+    return survivors
+
+def _genPrimeParallel(x: int, window: int = 1 << 15) -> int:
+    """Find the first prime at or after x, testing candidates on all cores.
+
+    The sieved survivors are independent, so they are handed to a process
+    pool in order-preserving batches; the first candidate reported prime
+    is the answer.
+
+    Args:
+        x (int): The starting candidate, larger than 2^16.
+        window (int, optional): The number of odd candidates per segment.
+
+    Returns:
+        int: The first prime at or after x.
+    """
+
+    if x % 2 == 0:
+        x += 1
+
+    batch = 8 * (os.cpu_count() or 1)
+    with concurrent.futures.ProcessPoolExecutor() as pool:
+        while True:
+            survivors = _sieveWindow(x, window)
+            candidates = [x + 2*i for i in range(window) if survivors[i]]
+
+            for start in range(0, len(candidates), batch):
+                chunk = candidates[start:start + batch]
+                for candidate, prime in zip(chunk, pool.map(isPrime, chunk)):
+                    if prime:
+                        return candidate
+
+            x += 2 * window
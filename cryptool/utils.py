@@ -1,10 +1,16 @@
 # This file contains utility functions for the Cryptool project.
 
+import math
 from math import log
 
+try:
+    from gmpy2 import gcdext
+except ImportError:
+    gcdext = None
+
 
 def gcd(a: int, b: int) -> int:
-    """Calculate the greatest common divisor of a and b using the Euclidean algorithm. 
+    """Calculate the greatest common divisor of a and b.
 
     Args:
         a (int): First integer.
@@ -14,21 +20,23 @@ def gcd(a: int, b: int) -> int:
         int: The greatest common divisor of a and b.
     """
 
-    while b:
-        a, b = b, a % b
-    return a
+    return math.gcd(a, b)
 
 def bezout(a: int, b: int) -> tuple[int, int, int]:
     """Extended Euclidean algorithm to find integers u and v such that au + bv = gcd(a, b).
-    
+
     Args:
         a (int): First integer.
         b (int): Second integer.
-        
+
     Returns:
         tuple[int, int, int]: A tuple containing gcd(a, b), u, and v.
     """
 
+    if gcdext is not None:
+        g, u, v = gcdext(a, b)
+        return int(g), int(u), int(v)
+
     u0, u1 = 1, 0
     v0, v1 = 0, 1
 
@@ -55,30 +63,11 @@ def inverse(x: int, n: int) -> int:
         int: The modular inverse of x modulo n if it exists, otherwise raises an error.
     """
 
-    thisGcd = gcd(x, n)
-
-    if thisGcd != 1:
+    try:
+        return pow(x % n, -1, n)
+    except ValueError:
         print(f"Error: The number {x} do not have an inverse modulo {n}.")
-
-    _, be1, _ = bezout(x, n)
-    return be1 % n
-
-def _primalityList(numList: list[int]) -> bool:
-    """Check if all numbers in the list are pairwise coprime.
-    
-    Args:
-        numList (list[int]): A list of integers to check for pairwise coprimality.
-
-    Returns:
-        bool: True if all numbers are pairwise coprime, False otherwise.
-    """
-
-    for i in range(len(numList)):
-        for j in range(i+1,len(numList)):
-            if gcd(numList[i], numList[j]) != 1:
-                return False
-            
-    return True
+        raise
 
 def chineseRemainder(listRemainders: list[int], listModulos: list[int]) -> int:
     """Solve the system of congruences using the Chinese Remainder Theorem.
@@ -94,22 +83,20 @@ def chineseRemainder(listRemainders: list[int], listModulos: list[int]) -> int:
     if len(listRemainders) != len(listModulos):
         print("The 2 lists need to have the same size.")
         return
-    
-    if not _primalityList(listModulos):
-        print("The modulos need to be pairwise coprime.")
-        return
-    
-    N = 1
-    x = 0
-    for modulo in listModulos:
-        N *= modulo
-
-    for i, j in zip(listRemainders, listModulos):
-        ni = N // j
-        bi = inverse(ni, j)
-        x += i * ni * bi
-    
-    return x % N
+
+    # Single pass: the coprimality check runs against the same partial
+    # product M that Garner's combination maintains, since the moduli are
+    # pairwise coprime iff each one is coprime to the product so far.
+    x = listRemainders[0] % listModulos[0]
+    M = listModulos[0]
+    for r, m in zip(listRemainders[1:], listModulos[1:]):
+        if gcd(m, M) != 1:
+            print("The modulos need to be pairwise coprime.")
+            return
+        x += M * (((r - x) * inverse(M, m)) % m)
+        M *= m
+
+    return x % M
 
 def isQuadraticResidue(a: int, p: int) -> bool:
     """Check if a is a quadratic residue modulo p using Euler's criterion.
@@ -173,13 +160,11 @@ def TonelliShanks(x: int, p: int) -> int:
         int: A square root of x modulo p.
     """
 
-    # Step 1: Write p - 1 as 2^k * q with q odd
-    k = 0
+    # Step 1: Write p - 1 as 2^k * q with q odd; the trailing-zero count
+    # comes from the isolated lowest set bit, no division loop.
     phiP = p - 1
-    while phiP % 2 == 0:
-        phiP //= 2
-        k += 1
-    q = phiP
+    k = (phiP & -phiP).bit_length() - 1
+    q = phiP >> k
 
     # Step 2: Find a quadratic non-residue z
     z = 2
@@ -193,12 +178,18 @@ def TonelliShanks(x: int, p: int) -> int:
 
     # Step 4: Main loop
     while t != 0 and t != 1:
+        # Find the least i with t^(2^i) == 1 by squaring incrementally,
+        # O(k) squarings instead of O(k^2).
         i = 0
+        t2 = t
         for i in range(1, k):
-            if pow(t, 2**i, p) == 1:
+            t2 = (t2 * t2) % p
+            if t2 == 1:
                 break
 
-        b = pow(c, 2**(k - i - 1), p)
+        b = c
+        for _ in range(k - i - 1):
+            b = (b * b) % p
         k = i
         c = (b * b) % p
         t = (t * c) % p
@@ -237,28 +228,34 @@ def quadraticEquationModP(A: int, B: int, C: int, p: int) -> tuple[int, int] | N
     return root1, root2
 
 def integerCubeRoot(n: int) -> int:
-    """Compute the integer cube root of n using binary search.
-    
+    """Compute the integer cube root of n using a seeded Newton iteration.
+
     Args:
         n (int): The integer to compute the cube root for.
-        
+
     Returns:
         int: The integer cube root of n.
     """
 
-    low = 0
-    high = n
+    if n == 0:
+        return 0
+
+    # Seed with an upper bound of the root, then refine with Newton steps
+    # from above. The float seed is only trusted while its rounding error
+    # is provably below 1 (error ~ n^(1/3) * 2^-52, so n^(1/3) < 2^50);
+    # beyond that the bit-length seed 2^ceil(bits/3) >= n^(1/3) is used.
+    if n.bit_length() < 150:
+        r = round(n ** (1 / 3)) + 1
+    else:
+        r = 1 << ((n.bit_length() + 2) // 3)
 
-    while low < high:
-        mid = (low + high) // 2
-        mid_cubed = mid * mid * mid
+    while r * r * r > n:
+        r = (2 * r + n // (r * r)) // 3
 
-        if mid_cubed < n:
-            low = mid + 1
-        else:
-            high = mid
+    while (r + 1) ** 3 <= n:
+        r += 1
 
-    return low if low * low * low == n else low - 1
+    return r
 
 
 def int2poly(x):